@@ -2,31 +2,49 @@ from __future__ import annotations
 
 import bisect
 
-from src.domain.journals import CompositeJournal
-from src.domain.core import Journal, CommittedItem, Counter, CommittedRepository
+from src.domain.journals import LiveJournal, MergedJournal, SnapshotJournal
+from src.domain.core import VOID, Journal, CommittedRepository
 
 
 class InMemoryCommittedRepository(CommittedRepository):
     def __init__(self):
-        self.offset_counter = Counter()
-        self.items: list[CommittedItem] = []
+        self.offset = 0
+        self.offsets: list[int] = []
+        self.payloads: list[Journal] = []
+        self.sizes: list[int] = []
+        self.head: dict = {}
 
     def get_journal(
             self,
             start_offset: int = 0,
             end_offset: int = None
     ) -> Journal:
+        if start_offset == 0 and end_offset is None:
+            return LiveJournal(journal=self.head)
         start_index = (
             0 if start_offset == 0
-            else bisect.bisect_left(self.items, start_offset, key=lambda x: x.offset)
+            else bisect.bisect_left(self.offsets, start_offset)
         )
         stop_index = (
             None if end_offset is None
-            else bisect.bisect_right(self.items, end_offset, key=lambda x: x.offset)
-        )
-        return CompositeJournal(
-            journals=reversed([i.payload for i in self.items[start_index:stop_index]])
+            else bisect.bisect_right(self.offsets, end_offset)
         )
+        journals = reversed(self.payloads[start_index:stop_index])
+        if start_offset == 0:
+            return SnapshotJournal(journals=journals, size=self.get_size(offset=end_offset))
+        return MergedJournal(journals=journals)
+
+    def add_committed_journal(self, offset: int, journal: Journal) -> None:
+        self.offsets.append(offset)
+        self.payloads.append(journal)
+        self.head.update(journal.items())
+        for key in [key for key, value in journal.items() if value is VOID]:
+            del self.head[key]
+        self.sizes.append(len(self.head))
 
-    def add_committed_item(self, item: CommittedItem) -> None:
-        self.items.append(item)
+    def get_size(self, offset: int = None) -> int:
+        index = (
+            len(self.sizes) if offset is None
+            else bisect.bisect_right(self.offsets, offset)
+        )
+        return self.sizes[index - 1] if index else 0
@@ -1,7 +1,5 @@
-from typing import Hashable, Any
-
 from src.exceptions import RepositoryError
-from src.domain.journals import LeafJournal, CompositeJournal, MutableJournal
+from src.domain.journals import CompositeJournal, MutableJournal
 from src.domain.core import Journal, UncommittedRepository, Transaction
 
 
@@ -14,14 +12,16 @@ class InMemoryUncommittedRepository(UncommittedRepository):
             raise RepositoryError("Transaction journal already exists")
         self.data[transaction] = MutableJournal()
 
-    def get_journal(self, transaction: Transaction = None) -> Journal:
-        if transaction is None:
-            return CompositeJournal(journals=self.data.values())
-        else:
-            return LeafJournal(journal=self.data[transaction])
+    def get_journal(self, transaction: Transaction) -> MutableJournal:
+        return self.data[transaction]
 
-    def add_value_to_journal(self, transaction: Transaction, key: Hashable, value: Any):
-        self.data[transaction][key] = value
+    def get_aggregated_journal(self) -> Journal:
+        return CompositeJournal(journals=self.data.values())
 
     def delete_journal(self, transaction: Transaction) -> None:
         del self.data[transaction]
+
+    def detach_journal(self, transaction: Transaction) -> MutableJournal:
+        journal = self.data[transaction]
+        self.data[transaction] = MutableJournal()
+        return journal
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
 import abc
-import dataclasses
 import enum
-from typing import Any, Mapping, Hashable, MutableMapping
+from typing import TYPE_CHECKING, Mapping, MutableMapping
 
+if TYPE_CHECKING:
+    from src.domain.journals import MutableJournal
 
-class Void:
-    def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Void)
+
+VOID = object()
 
 
 class Journal(Mapping, abc.ABC):
-    pass
+    __slots__ = ()
+    void_free = False
+
+    def live_len(self) -> int:
+        return sum(
+            1
+            for value in self.values()
+            if value is not VOID
+        )
 
 
 class UncommittedRepository(abc.ABC):
@@ -21,11 +29,11 @@ class UncommittedRepository(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def get_journal(self, transaction: Transaction = None) -> Journal:
+    def get_journal(self, transaction: Transaction) -> MutableJournal:
         ...
 
     @abc.abstractmethod
-    def add_value_to_journal(self, transaction: Transaction, key: Hashable, value: Any) -> None:
+    def get_aggregated_journal(self) -> Journal:
         ...
 
     @abc.abstractmethod
@@ -33,31 +41,17 @@ class UncommittedRepository(abc.ABC):
         ...
 
     def recreate_journal(self, transaction: Transaction) -> None:
+        self.get_journal(transaction=transaction).clear()
+
+    def detach_journal(self, transaction: Transaction) -> MutableJournal:
+        journal = self.get_journal(transaction=transaction)
         self.delete_journal(transaction=transaction)
         self.create_journal(transaction=transaction)
-
-
-@dataclasses.dataclass
-class CommittedItem:
-    offset: int
-    payload: Journal
-
-
-class Counter:
-    def __init__(self, start: int = 0, step: int = 1) -> None:
-        self._current = start
-        self._step = step
-
-    def shift(self):
-        self._current += self._step
-
-    @property
-    def current(self):
-        return self._current
+        return journal
 
 
 class CommittedRepository(abc.ABC):
-    offset_counter: Counter
+    offset: int
 
     def __getitem__(self, item):
         match item:
@@ -76,20 +70,20 @@ class CommittedRepository(abc.ABC):
         ...
 
     def commit_journal(self, journal: Journal) -> None:
-        self.offset_counter.shift()
-        item = CommittedItem(
-            offset=self.offset_counter.current,
-            payload=journal
-        )
-        self.add_committed_item(item=item)
+        self.offset += 1
+        self.add_committed_journal(offset=self.offset, journal=journal)
+
+    @abc.abstractmethod
+    def add_committed_journal(self, offset: int, journal: Journal) -> None:
+        ...
 
     @abc.abstractmethod
-    def add_committed_item(self, item: CommittedItem) -> None:
+    def get_size(self, offset: int = None) -> int:
         ...
 
     @property
     def last_offset(self) -> int:
-        return self.offset_counter.current
+        return self.offset
 
 
 class JournalRepository:
@@ -107,22 +101,21 @@ class JournalRepository:
     def delete_uncommitted_journal(self, transaction: Transaction) -> None:
         self._uncommitted_repository.delete_journal(transaction=transaction)
 
-    def add_value_to_uncommitted_journal(self, transaction: Transaction, key: Hashable, value: Any) -> None:
-        self._uncommitted_repository.add_value_to_journal(transaction=transaction, key=key, value=value)
-
-    def get_uncommitted_journal_by_transaction(self, transaction: Transaction) -> Journal:
+    def get_uncommitted_journal_by_transaction(self, transaction: Transaction) -> MutableJournal:
         return self._uncommitted_repository.get_journal(transaction=transaction)
 
     def get_aggregated_uncommitted_journal(self) -> Journal:
-        return self._uncommitted_repository.get_journal()
+        return self._uncommitted_repository.get_aggregated_journal()
 
     def get_committed_journal(self, start_offset: int = 0, end_offset: int = None) -> Journal:
         return self._committed_repository.get_journal(start_offset=start_offset, end_offset=end_offset)
 
+    def get_committed_size(self, offset: int = None) -> int:
+        return self._committed_repository.get_size(offset=offset)
+
     def commit(self, transaction: Transaction):
-        journal = self._uncommitted_repository.get_journal(transaction=transaction)
+        journal = self._uncommitted_repository.detach_journal(transaction=transaction)
         self._committed_repository.commit_journal(journal=journal)
-        self._uncommitted_repository.recreate_journal(transaction=transaction)
 
     def rollback(self, transaction: Transaction):
         self._uncommitted_repository.recreate_journal(transaction=transaction)
@@ -140,55 +133,79 @@ class IsolationLevel(enum.Enum):
 
 
 class Transaction(abc.ABC, MutableMapping):
-    journal_repository: JournalRepository
+    __slots__ = ('journal_repository', '_state', '_state_offset', '_uncommitted_journal')
+
+    def __init__(self, journal_repository: JournalRepository) -> None:
+        self.journal_repository = journal_repository
+        self._state = None
+        self._state_offset = None
+        self._uncommitted_journal = None
 
     def __getitem__(self, item):
-        value = self.state[item]
-        if isinstance(value, Void):
-            raise KeyError()
+        value = self.state.get(item, VOID)
+        if value is VOID:
+            raise KeyError(item)
         return value
 
     @property
-    @abc.abstractmethod
     def state(self) -> Journal:
+        state_offset = self.state_offset
+        if self._state is None or self._state_offset != state_offset:
+            self._state = self.build_state()
+            self._state_offset = state_offset
+        return self._state
+
+    @property
+    def state_offset(self) -> int:
+        return self.journal_repository.last_offset
+
+    @abc.abstractmethod
+    def build_state(self) -> Journal:
         ...
 
+    def reset_state(self) -> None:
+        self._state = None
+        self._uncommitted_journal = None
+
+    @property
+    def uncommitted_journal(self) -> MutableJournal:
+        if self._uncommitted_journal is None:
+            self._uncommitted_journal = self.journal_repository.get_uncommitted_journal_by_transaction(
+                transaction=self
+            )
+        return self._uncommitted_journal
+
     def __setitem__(self, key, value):
-        self.journal_repository.add_value_to_uncommitted_journal(transaction=self, key=key, value=value)
+        self.uncommitted_journal[key] = value
 
     def __delitem__(self, key):
-        if isinstance(self.state.get(key, Void()), Void):
-            raise KeyError()
-        self.journal_repository.add_value_to_uncommitted_journal(transaction=self, key=key, value=Void())
+        if self.state.get(key, VOID) is VOID:
+            raise KeyError(key)
+        self.uncommitted_journal[key] = VOID
 
     def __contains__(self, item):
-        value = self.state.get(item, Void())
-        return not isinstance(value, Void)
+        return self.state.get(item, VOID) is not VOID
 
     def __iter__(self):
         return (
             key
             for key, value in self.state.items()
-            if not isinstance(value, Void)
+            if value is not VOID
         )
 
     def __len__(self):
-        return sum(
-            not isinstance(value, Void)
-            for value in self.state.values()
-        )
+        return self.state.live_len()
 
     def commit(self):
         self.journal_repository.commit(transaction=self)
+        self.reset_state()
 
     def rollback(self):
         self.journal_repository.rollback(transaction=self)
+        self.reset_state()
 
-    def __hash__(self):
-        return id(self)
-
-    def __eq__(self, other):
-        return self is other
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
 
     def __enter__(self):
         self.start()
@@ -199,6 +216,7 @@ class Transaction(abc.ABC, MutableMapping):
 
     def start(self):
         self.journal_repository.create_uncommitted_journal(transaction=self)
+        self.reset_state()
 
     def end(self):
         self.journal_repository.delete_uncommitted_journal(transaction=self)
@@ -209,6 +227,31 @@ class TransactionFactory(abc.ABC):
     def create_transaction(self, isolation_level: IsolationLevel) -> Transaction:
         ...
 
+    @abc.abstractmethod
+    def get_committed_snapshot(self) -> Journal:
+        ...
+
+
+class TransactionPool:
+    __slots__ = ('_transaction_factory', '_isolation_level', '_transactions')
+
+    def __init__(self, transaction_factory: TransactionFactory, isolation_level: IsolationLevel) -> None:
+        self._transaction_factory = transaction_factory
+        self._isolation_level = isolation_level
+        self._transactions: list[Transaction] = []
+
+    def acquire(self) -> Transaction:
+        if self._transactions:
+            transaction = self._transactions.pop()
+        else:
+            transaction = self._transaction_factory.create_transaction(isolation_level=self._isolation_level)
+        transaction.start()
+        return transaction
+
+    def release(self, transaction: Transaction) -> None:
+        transaction.end()
+        self._transactions.append(transaction)
+
 
 class JournalRepositoryFactory(abc.ABC):
     @abc.abstractmethod
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import collections
 from typing import Iterable
 
-from src.domain.core import Journal
+from src.domain.core import VOID, Journal
 
+MISSING = object()
 
-class LeafJournal(Journal):
-    def __init__(self, journal: Journal) -> None:
+
+class DictJournal(Journal):
+    __slots__ = ('journal',)
+
+    def __init__(self, journal: dict) -> None:
         self.journal = journal
 
     def __getitem__(self, item):
@@ -19,33 +22,172 @@ class LeafJournal(Journal):
     def __iter__(self):
         return iter(self.journal)
 
+    def __contains__(self, item):
+        return item in self.journal
 
-class CompositeJournal(Journal):
-    def __init__(self, journals: Iterable[Journal]) -> None:
-        self.journal = collections.ChainMap(*journals)
+    def get(self, key, default=None):
+        return self.journal.get(key, default)
+
+    def keys(self):
+        return self.journal.keys()
+
+    def values(self):
+        return self.journal.values()
+
+    def items(self):
+        return self.journal.items()
+
+
+class LiveJournal(DictJournal):
+    __slots__ = ()
+    void_free = True
+
+    def live_len(self) -> int:
+        return len(self.journal)
+
+
+class VisibleJournal(Journal):
+    __slots__ = ('journal',)
+    void_free = True
+
+    def __init__(self, journal: Journal) -> None:
+        self.journal = journal
 
     def __getitem__(self, item):
-        return self.journal[item]
+        value = self.journal[item]
+        if value is VOID:
+            raise KeyError(item)
+        return value
 
     def __len__(self):
-        return len(self.journal)
+        return self.journal.live_len()
+
+    def __contains__(self, item):
+        return self.journal.get(item, VOID) is not VOID
+
+    def get(self, key, default=None):
+        value = self.journal.get(key, VOID)
+        return default if value is VOID else value
+
+    def live_len(self) -> int:
+        return len(self)
 
     def __iter__(self):
-        return iter(self.journal)
+        return (
+            key
+            for key, value in self.journal.items()
+            if value is not VOID
+        )
 
 
-class MutableJournal(Journal):
-    def __init__(self):
-        self.journal = {}
+class CompositeJournal(Journal):
+    __slots__ = ('journals',)
+
+    def __init__(self, journals: Iterable[Journal]) -> None:
+        self.journals = tuple(journals)
 
     def __getitem__(self, item):
-        return self.journal[item]
+        value = self.get(item, MISSING)
+        if value is MISSING:
+            raise KeyError(item)
+        return value
 
     def __len__(self):
-        return len(self.journal)
+        return len(self.merge())
 
     def __iter__(self):
-        return iter(self.journal)
+        return iter(self.merge())
+
+    def __contains__(self, item):
+        return any(item in journal for journal in self.journals)
+
+    def get(self, key, default=None):
+        for journal in self.journals:
+            value = journal.get(key, MISSING)
+            if value is not MISSING:
+                return value
+        return default
+
+    def keys(self):
+        return self.merge().keys()
+
+    def values(self):
+        return self.merge().values()
+
+    def items(self):
+        return self.merge().items()
+
+    def merge(self) -> dict:
+        merged = {}
+        for journal in reversed(self.journals):
+            merged.update(journal.items())
+        return merged
+
+    def live_len(self) -> int:
+        if not self.journals:
+            return 0
+        *overlays, base = self.journals
+        if not overlays:
+            return base.live_len()
+        overlay = (
+            overlays[0] if len(overlays) == 1
+            else CompositeJournal(journals=overlays)
+        )
+        counter = base.live_len()
+        for key, value in overlay.items():
+            counter += (value is not VOID) - (base.get(key, VOID) is not VOID)
+        return counter
+
+
+class MergedJournal(CompositeJournal):
+    __slots__ = ('merged',)
+
+    def __init__(self, journals: Iterable[Journal]) -> None:
+        super().__init__(journals=journals)
+        self.merged = None
+
+    def __contains__(self, item):
+        if self.merged is not None:
+            return item in self.merged
+        return super().__contains__(item)
+
+    def get(self, key, default=None):
+        if self.merged is not None:
+            return self.merged.get(key, default)
+        return super().get(key, default)
+
+    def merge(self) -> dict:
+        if self.merged is None:
+            self.merged = super().merge()
+        return self.merged
+
+
+class SnapshotJournal(MergedJournal):
+    __slots__ = ('size',)
+
+    def __init__(self, journals: Iterable[Journal], size: int) -> None:
+        super().__init__(journals=journals)
+        self.size = size
+
+    def live_len(self) -> int:
+        return self.size
+
+    def merge(self) -> dict:
+        if self.merged is None:
+            merged = {}
+            for journal in reversed(self.journals):
+                merged.update(journal.items())
+                for key in [key for key, value in journal.items() if value is VOID]:
+                    del merged[key]
+            self.merged = merged
+        return self.merged
+
+
+class MutableJournal(DictJournal):
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(journal={})
 
     def __setitem__(self, key, value):
         self.journal[key] = value
@@ -54,4 +196,4 @@ class MutableJournal(Journal):
         del self.journal[key]
 
     def clear(self):
-        self.journal = {}
+        self.journal.clear()
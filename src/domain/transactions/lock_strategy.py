@@ -6,53 +6,74 @@ from src.domain.journals import CompositeJournal
 from src.domain.core import JournalRepository, Transaction
 
 
-class AnyKey:
-    pass
-
-
 class AccessProtector:
+    __slots__ = ('locks', 'locks_by_transaction', 'full_locker')
+
     def __init__(self):
         self.locks: dict[Hashable, Transaction] = {}
-        self.any_key = AnyKey()
+        self.locks_by_transaction: dict[Transaction, set[Hashable]] = {}
+        self.full_locker: Transaction | None = None
 
     def add_key_lock(self, transaction: Transaction, key: Hashable) -> None:
         if (
-                key in self.locks and self.locks[key] != transaction
-                or self.any_key in self.locks and self.locks[self.any_key] != transaction
+                self.locks.get(key, transaction) is not transaction
+                or self.full_locker is not None and self.full_locker is not transaction
         ):
             raise AccessError()
         self.locks[key] = transaction
+        self.locks_by_transaction.setdefault(transaction, set()).add(key)
 
     def add_full_lock(self, transaction: Transaction) -> None:
-        if set(self.locks.values()) - {transaction}:
+        if (
+                self.full_locker is not None and self.full_locker is not transaction
+                or len(self.locks_by_transaction) > (transaction in self.locks_by_transaction)
+        ):
             raise AccessError()
-        self.locks[self.any_key] = transaction
+        self.full_locker = transaction
 
     def del_key_lock(self, key: Hashable) -> None:
-        del self.locks[key]
+        transaction = self.locks.pop(key)
+        keys = self.locks_by_transaction[transaction]
+        keys.discard(key)
+        if not keys:
+            del self.locks_by_transaction[transaction]
 
     def del_full_lock(self) -> None:
-        del self.locks[self.any_key]
+        if self.full_locker is None:
+            raise KeyError()
+        self.full_locker = None
 
     def clear_locks_by_transaction(self, transaction: Transaction) -> None:
-        self.locks = {
-            key: locker
-            for key, locker in self.locks.items()
-            if locker is not transaction
-        }
+        for key in self.locks_by_transaction.pop(transaction, ()):
+            del self.locks[key]
+        if self.full_locker is transaction:
+            self.full_locker = None
 
 
 class LockStrategyTransaction(Transaction, abc.ABC):
+    __slots__ = ('access_protector',)
+
     def __init__(self, journal_repository: JournalRepository, access_protector: AccessProtector):
-        self.journal_repository = journal_repository
+        super().__init__(journal_repository=journal_repository)
         self.access_protector = access_protector
 
-    def __setitem__(self, key, value):
+    def lock_key(self, key):
         self.access_protector.add_key_lock(transaction=self, key=key)
+
+    def build_state(self) -> CompositeJournal:
+        return CompositeJournal(
+            journals=(
+                self.uncommitted_journal,
+                self.journal_repository.get_committed_journal()
+            )
+        )
+
+    def __setitem__(self, key, value):
+        self.lock_key(key)
         super().__setitem__(key, value)
 
     def __delitem__(self, key):
-        self.access_protector.add_key_lock(transaction=self, key=key)
+        self.lock_key(key)
         super().__delitem__(key)
 
     def commit(self):
@@ -69,8 +90,13 @@ class LockStrategyTransaction(Transaction, abc.ABC):
 
 
 class ReadUncommittedLockStrategyTransaction(LockStrategyTransaction):
+    __slots__ = ()
+
     @property
     def state(self) -> CompositeJournal:
+        return self.build_state()
+
+    def build_state(self) -> CompositeJournal:
         return CompositeJournal(
             journals=(
                 self.journal_repository.get_aggregated_uncommitted_journal(),
@@ -80,28 +106,14 @@ class ReadUncommittedLockStrategyTransaction(LockStrategyTransaction):
 
 
 class ReadCommittedLockStrategyTransaction(LockStrategyTransaction):
-    @property
-    def state(self) -> CompositeJournal:
-        return CompositeJournal(
-            journals=(
-                self.journal_repository.get_uncommitted_journal_by_transaction(transaction=self),
-                self.journal_repository.get_committed_journal()
-            )
-        )
+    __slots__ = ()
 
 
 class RepeatableReadLockStrategyTransaction(LockStrategyTransaction):
-    @property
-    def state(self) -> CompositeJournal:
-        return CompositeJournal(
-            journals=(
-                self.journal_repository.get_uncommitted_journal_by_transaction(transaction=self),
-                self.journal_repository.get_committed_journal()
-            )
-        )
+    __slots__ = ()
 
     def __getitem__(self, item):
-        self.access_protector.add_key_lock(transaction=self, key=item)
+        self.lock_key(item)
         return super().__getitem__(item)
 
     def __contains__(self, item):
@@ -109,25 +121,20 @@ class RepeatableReadLockStrategyTransaction(LockStrategyTransaction):
         return super().__contains__(item)
 
     def __iter__(self):
+        lock_key = self.lock_key
         keys = []
+        append = keys.append
         for key in super().__iter__():
-            self.access_protector.add_key_lock(transaction=self, key=key)
-            keys.append(key)
+            lock_key(key)
+            append(key)
         return iter(keys)
 
 
 class SerializableLockStrategyTransaction(LockStrategyTransaction):
-    @property
-    def state(self) -> CompositeJournal:
-        return CompositeJournal(
-            journals=(
-                self.journal_repository.get_uncommitted_journal_by_transaction(transaction=self),
-                self.journal_repository.get_committed_journal()
-            )
-        )
+    __slots__ = ()
 
     def __getitem__(self, item):
-        self.access_protector.add_key_lock(transaction=self, key=item)
+        self.lock_key(item)
         return super().__getitem__(item)
 
     def __contains__(self, item):
@@ -2,38 +2,91 @@ from __future__ import annotations
 
 from typing import MutableMapping
 
-from src.domain.core import IsolationLevel, Transaction, TransactionFactory
+from src.domain.core import IsolationLevel, Journal, Transaction, TransactionFactory, TransactionPool
+
+_MISSING = object()
 
 
 class TransactionDict(MutableMapping):
+    __slots__ = ('transaction_factory', 'transaction_pool')
+
     def __init__(self, transaction_factory: TransactionFactory):
         self.transaction_factory = transaction_factory
+        self.transaction_pool = TransactionPool(
+            transaction_factory=transaction_factory,
+            isolation_level=IsolationLevel.READ_COMMITTED,
+        )
 
     def __getitem__(self, item):
-        with self.create_transaction(isolation_level=IsolationLevel.READ_COMMITTED) as transaction:
-            return transaction[item]
+        return self.get_committed_snapshot()[item]
 
     def __setitem__(self, key, value):
-        with self.create_transaction(isolation_level=IsolationLevel.READ_COMMITTED) as transaction:
+        transaction_pool = self.transaction_pool
+        transaction = transaction_pool.acquire()
+        try:
             transaction[key] = value
             transaction.commit()
+        finally:
+            transaction_pool.release(transaction)
 
     def __delitem__(self, key):
-        with self.create_transaction(isolation_level=IsolationLevel.READ_COMMITTED) as transaction:
+        transaction_pool = self.transaction_pool
+        transaction = transaction_pool.acquire()
+        try:
             del transaction[key]
             transaction.commit()
+        finally:
+            transaction_pool.release(transaction)
+
+    def pop(self, key, default=_MISSING):
+        value = self.get_committed_snapshot().get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        del self[key]
+        return value
+
+    def popitem(self):
+        for key, value in self.get_committed_snapshot().items():
+            break
+        else:
+            raise KeyError()
+        del self[key]
+        return key, value
+
+    def setdefault(self, key, default=None):
+        value = self.get_committed_snapshot().get(key, _MISSING)
+        if value is _MISSING:
+            self[key] = default
+            return default
+        return value
+
+    def update(self, other=(), /, **kwargs):
+        if not other and not kwargs:
+            return
+        transaction_pool = self.transaction_pool
+        transaction = transaction_pool.acquire()
+        try:
+            transaction.update(other, **kwargs)
+            transaction.commit()
+        finally:
+            transaction_pool.release(transaction)
 
     def __contains__(self, item):
-        with self.create_transaction(isolation_level=IsolationLevel.READ_COMMITTED) as transaction:
-            return item in transaction
+        return item in self.get_committed_snapshot()
 
     def __iter__(self):
-        with self.create_transaction(isolation_level=IsolationLevel.READ_COMMITTED) as transaction:
-            return iter(transaction)
+        return iter(tuple(self.get_committed_snapshot()))
 
     def __len__(self):
-        with self.create_transaction(isolation_level=IsolationLevel.READ_COMMITTED) as transaction:
-            return len(transaction)
+        return len(self.get_committed_snapshot())
+
+    def get(self, key, default=None):
+        return self.get_committed_snapshot().get(key, default)
 
     def create_transaction(self, isolation_level: IsolationLevel) -> Transaction:
         return self.transaction_factory.create_transaction(isolation_level=isolation_level)
+
+    def get_committed_snapshot(self) -> Journal:
+        return self.transaction_factory.get_committed_snapshot()
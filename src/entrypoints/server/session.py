@@ -1,65 +1,61 @@
 from collections.abc import MutableMapping
 
 from src.exceptions import SessionError
-from src.domain.core import IsolationLevel, Transaction, TransactionFactory
+from src.domain.core import IsolationLevel, Journal, Transaction, TransactionFactory, TransactionPool
 
 
 class Session(MutableMapping):
+    __slots__ = ('transaction_factory', 'transaction_pool', 'transaction')
+
     def __init__(self, transaction_factory: TransactionFactory):
         self.transaction_factory = transaction_factory
+        self.transaction_pool = TransactionPool(
+            transaction_factory=transaction_factory,
+            isolation_level=IsolationLevel.READ_COMMITTED,
+        )
         self.transaction = None
 
     def __getitem__(self, item):
         if not self.is_transaction_opened():
-            with self.transaction_factory.create_transaction(
-                    isolation_level=IsolationLevel.READ_COMMITTED
-            ) as transaction:
-                return transaction[item]
+            return self.get_committed_snapshot()[item]
         else:
             return self.transaction[item]
 
     def __setitem__(self, key, value):
         if not self.is_transaction_opened():
-            with self.transaction_factory.create_transaction(
-                    isolation_level=IsolationLevel.READ_COMMITTED
-            ) as transaction:
+            transaction = self.transaction_pool.acquire()
+            try:
                 transaction[key] = value
+            finally:
+                self.transaction_pool.release(transaction)
         else:
             self.transaction[key] = value
 
     def __delitem__(self, key):
         if not self.is_transaction_opened():
-            with self.transaction_factory.create_transaction(
-                    isolation_level=IsolationLevel.READ_COMMITTED
-            ) as transaction:
+            transaction = self.transaction_pool.acquire()
+            try:
                 del transaction[key]
+            finally:
+                self.transaction_pool.release(transaction)
         else:
             del self.transaction[key]
 
     def __contains__(self, item):
         if not self.is_transaction_opened():
-            with self.transaction_factory.create_transaction(
-                    isolation_level=IsolationLevel.READ_COMMITTED
-            ) as transaction:
-                return item in transaction
+            return item in self.get_committed_snapshot()
         else:
             return item in self.transaction
 
     def __iter__(self):
         if not self.is_transaction_opened():
-            with self.transaction_factory.create_transaction(
-                    isolation_level=IsolationLevel.READ_COMMITTED
-            ) as transaction:
-                return iter(transaction)
+            return iter(tuple(self.get_committed_snapshot()))
         else:
             return iter(self.transaction)
 
     def __len__(self):
         if not self.is_transaction_opened():
-            with self.transaction_factory.create_transaction(
-                    isolation_level=IsolationLevel.READ_COMMITTED
-            ) as transaction:
-                return len(transaction)
+            return len(self.get_committed_snapshot())
         else:
             return len(self.transaction)
 
@@ -83,5 +79,8 @@ class Session(MutableMapping):
     def create_transaction(self, isolation_level: IsolationLevel) -> Transaction:
         return self.transaction_factory.create_transaction(isolation_level=isolation_level)
 
+    def get_committed_snapshot(self) -> Journal:
+        return self.transaction_factory.get_committed_snapshot()
+
     def is_transaction_opened(self) -> bool:
         return self.transaction is not None
@@ -1,11 +1,16 @@
+import abc
+
 from src.adapters.repositories.committed_repositories import InMemoryCommittedRepository
 from src.adapters.repositories.uncommitted_repositories import InMemoryUncommittedRepository
 from src.exceptions import TransactionLevelIsNotImplemented
-from src.domain.core import JournalRepository, IsolationLevel, Transaction, TransactionFactory, JournalRepositoryFactory
-from src.domain.transactions.lock_strategy import AccessProtector, ReadUncommittedLockStrategyTransaction, \
-    ReadCommittedLockStrategyTransaction, RepeatableReadLockStrategyTransaction, SerializableLockStrategyTransaction
-from src.domain.transactions.multi_version_strategy import ReadCommittedMultiVersionStrategyTransaction, \
-    RepeatableReadMultiVersionStrategyTransaction, SerializableMultiVersionStrategyTransaction
+from src.domain.journals import VisibleJournal
+from src.domain.core import Journal, JournalRepository, IsolationLevel, Transaction, TransactionFactory, JournalRepositoryFactory
+from src.domain.transactions.lock_strategy import AccessProtector, LockStrategyTransaction, \
+    ReadUncommittedLockStrategyTransaction, ReadCommittedLockStrategyTransaction, \
+    RepeatableReadLockStrategyTransaction, SerializableLockStrategyTransaction
+from src.domain.transactions.multi_version_strategy import MultiVersionStrategyTransaction, \
+    ReadCommittedMultiVersionStrategyTransaction, RepeatableReadMultiVersionStrategyTransaction, \
+    SerializableMultiVersionStrategyTransaction
 
 
 class InMemoryJournalRepositoryFactory(JournalRepositoryFactory):
@@ -16,54 +21,46 @@ class InMemoryJournalRepositoryFactory(JournalRepositoryFactory):
         )
 
 
-class LockStrategyTransactionFactory(TransactionFactory):
-    def __init__(self, journal_repository: JournalRepository, access_protector: AccessProtector):
+class JournalTransactionFactory(TransactionFactory, abc.ABC):
+    def __init__(self, journal_repository: JournalRepository):
         self._journal_repository = journal_repository
+
+    def get_committed_snapshot(self) -> Journal:
+        journal = self._journal_repository.get_committed_journal()
+        return journal if journal.void_free else VisibleJournal(journal=journal)
+
+
+class LockStrategyTransactionFactory(JournalTransactionFactory):
+    transaction_classes: dict[IsolationLevel, type[LockStrategyTransaction]] = {
+        IsolationLevel.READ_UNCOMMITTED: ReadUncommittedLockStrategyTransaction,
+        IsolationLevel.READ_COMMITTED: ReadCommittedLockStrategyTransaction,
+        IsolationLevel.REPEATABLE_READ: RepeatableReadLockStrategyTransaction,
+        IsolationLevel.SERIALIZABLE: SerializableLockStrategyTransaction,
+    }
+
+    def __init__(self, journal_repository: JournalRepository, access_protector: AccessProtector):
+        super().__init__(journal_repository=journal_repository)
         self._access_protector = access_protector
 
     def create_transaction(self, isolation_level: IsolationLevel) -> Transaction:
-        match isolation_level:
-            case IsolationLevel.READ_UNCOMMITTED:
-                return ReadUncommittedLockStrategyTransaction(
-                    journal_repository=self._journal_repository,
-                    access_protector=self._access_protector,
-                )
-            case IsolationLevel.READ_COMMITTED:
-                return ReadCommittedLockStrategyTransaction(
-                    journal_repository=self._journal_repository,
-                    access_protector=self._access_protector,
-                )
-            case IsolationLevel.REPEATABLE_READ:
-                return RepeatableReadLockStrategyTransaction(
-                    journal_repository=self._journal_repository,
-                    access_protector=self._access_protector,
-                )
-            case IsolationLevel.SERIALIZABLE:
-                return SerializableLockStrategyTransaction(
-                    journal_repository=self._journal_repository,
-                    access_protector=self._access_protector,
-                )
-            case _:
-                raise TransactionLevelIsNotImplemented()
+        transaction_class = self.transaction_classes.get(isolation_level)
+        if transaction_class is None:
+            raise TransactionLevelIsNotImplemented()
+        return transaction_class(
+            journal_repository=self._journal_repository,
+            access_protector=self._access_protector,
+        )
 
 
-class MultiVersionStrategyTransactionFactory(TransactionFactory):
-    def __init__(self, journal_repository: JournalRepository):
-        self._journal_repository = journal_repository
+class MultiVersionStrategyTransactionFactory(JournalTransactionFactory):
+    transaction_classes: dict[IsolationLevel, type[MultiVersionStrategyTransaction]] = {
+        IsolationLevel.READ_COMMITTED: ReadCommittedMultiVersionStrategyTransaction,
+        IsolationLevel.REPEATABLE_READ: RepeatableReadMultiVersionStrategyTransaction,
+        IsolationLevel.SERIALIZABLE: SerializableMultiVersionStrategyTransaction,
+    }
 
     def create_transaction(self, isolation_level: IsolationLevel) -> Transaction:
-        match isolation_level:
-            case IsolationLevel.READ_COMMITTED:
-                return ReadCommittedMultiVersionStrategyTransaction(
-                    journal_repository=self._journal_repository,
-                )
-            case IsolationLevel.REPEATABLE_READ:
-                return RepeatableReadMultiVersionStrategyTransaction(
-                    journal_repository=self._journal_repository,
-                )
-            case IsolationLevel.SERIALIZABLE:
-                return SerializableMultiVersionStrategyTransaction(
-                    journal_repository=self._journal_repository,
-                )
-            case _:
-                raise TransactionLevelIsNotImplemented()
+        transaction_class = self.transaction_classes.get(isolation_level)
+        if transaction_class is None:
+            raise TransactionLevelIsNotImplemented()
+        return transaction_class(journal_repository=self._journal_repository)
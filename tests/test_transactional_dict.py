@@ -1,6 +1,7 @@
 import itertools
 from unittest import TestCase
 
+from src.domain.core import IsolationLevel
 from src.factory import InMemoryJournalRepositoryFactory, MultiVersionStrategyTransactionFactory
 from src.entrypoints.locallib.transaction_dict import TransactionDict
 
@@ -8,6 +9,25 @@ factory = InMemoryJournalRepositoryFactory()
 
 
 class TransactionDictTestCase(TestCase):
+    keys_for_creating = ['test_key1', 'test_key2', 'test_key3']
+    keys_for_removing = ['test_key4', 'test_key5', 'test_key6']
+    keys_for_recreating = ['test_key7', 'test_key8', 'test_key9']
+    keys_for_recreating_and_removing = ['test_key10', 'test_key11', 'test_key12']
+    keys = [
+        *keys_for_creating,
+        *keys_for_removing,
+        *keys_for_recreating,
+        *keys_for_recreating_and_removing
+    ]
+    actual_keys = [
+        *keys_for_creating,
+        *keys_for_recreating
+    ]
+    removed_keys = [
+        *keys_for_removing,
+        *keys_for_recreating_and_removing
+    ]
+
     def setUp(self):
         self.transaction_dict = TransactionDict(
             transaction_factory=MultiVersionStrategyTransactionFactory(
@@ -18,24 +38,6 @@ class TransactionDictTestCase(TestCase):
         self.value1 = 'test_value1'
         self.value2 = 'test_value2'
         self.value3 = 'test_value3'
-        self.keys_for_creating = ['test_key1', 'test_key2', 'test_key3']
-        self.keys_for_removing = ['test_key4', 'test_key5', 'test_key6']
-        self.keys_for_recreating = ['test_key7', 'test_key8', 'test_key9']
-        self.keys_for_recreating_and_removing = ['test_key10', 'test_key11', 'test_key12']
-        self.keys = [
-            *self.keys_for_creating,
-            *self.keys_for_removing,
-            *self.keys_for_recreating,
-            *self.keys_for_recreating_and_removing
-        ]
-        self.actual_keys = [
-            *self.keys_for_creating,
-            *self.keys_for_recreating
-        ]
-        self.removed_keys = [
-            *self.keys_for_removing,
-            *self.keys_for_recreating_and_removing
-        ]
 
     def fill_dict(self) -> TransactionDict:
         for key in self.keys:
@@ -154,8 +156,9 @@ class TransactionDictTestCase(TestCase):
         for key in self.keys_for_creating:
             self.assertEqual(d.pop(key, self.value3), self.value1)
         for key in self.removed_keys:
-            with self.assertRaises(KeyError):
+            with self.assertRaises(KeyError) as context:
                 d.pop(key)
+            self.assertEqual(context.exception.args, (key,))
         for key in self.keys_for_creating:
             self.assertEqual(d.pop(key, self.value3), self.value3)
 
@@ -205,6 +208,29 @@ class TransactionDictTestCase(TestCase):
         for key in self.keys:
             self.assertEqual(d[key], self.value3)
 
+    def test_update_commits_nothing_when_interrupted(self):
+        def items():
+            yield self.key, self.value1
+            raise ValueError()
+        d = self.fill_dict()
+        with self.assertRaises(ValueError):
+            d.update(items())
+        self.assertNotIn(self.key, d)
+        self.assertListEqual(self.actual_keys, list(d))
+
+    def test_empty_update_commits_nothing(self):
+        journal_repository = factory.get_journal_repository()
+        d = TransactionDict(
+            transaction_factory=MultiVersionStrategyTransactionFactory(
+                journal_repository=journal_repository,
+            )
+        )
+        d.update()
+        d.update({})
+        d.update([])
+        self.assertEqual(journal_repository.last_offset, 0)
+        self.assertEqual(len(d), 0)
+
     def test_can_update_empty_dict(self):
         self.transaction_dict.update({self.key: self.value1})
         self.assertEqual(len(self.transaction_dict), 1)
@@ -229,3 +255,45 @@ class TransactionDictTestCase(TestCase):
         value = self.transaction_dict.setdefault(self.key, self.value3)
         self.assertEqual(value, self.value3)
         self.assertEqual(self.transaction_dict[self.key], self.value3)
+
+    def test_can_write_through_two_dicts_on_one_repository(self):
+        transaction_factory = MultiVersionStrategyTransactionFactory(
+            journal_repository=factory.get_journal_repository(),
+        )
+        d1 = TransactionDict(transaction_factory=transaction_factory)
+        d2 = TransactionDict(transaction_factory=transaction_factory)
+        d1[self.key] = self.value1
+        d2[self.key] = self.value2
+        d1[self.key] = self.value3
+        self.assertEqual(d2[self.key], self.value3)
+
+    def test_can_delete_keys_while_iterating(self):
+        d = self.fill_dict()
+        for key in d:
+            del d[key]
+        self.assertEqual(len(d), 0)
+
+    def test_can_write_keys_while_iterating(self):
+        d = self.fill_dict()
+        for key in d:
+            d[key + '_copy'] = d[key]
+        self.assertEqual(len(d), 2 * len(self.actual_keys))
+
+    def test_recreated_key_moves_to_end(self):
+        other_key = self.keys_for_creating[0]
+        self.transaction_dict[self.key] = self.value1
+        self.transaction_dict[other_key] = self.value2
+        del self.transaction_dict[self.key]
+        self.transaction_dict[self.key] = self.value3
+        self.assertListEqual([other_key, self.key], list(self.transaction_dict))
+        isolation_levels = (
+            IsolationLevel.READ_COMMITTED,
+            IsolationLevel.REPEATABLE_READ,
+            IsolationLevel.SERIALIZABLE,
+        )
+        for isolation_level in isolation_levels:
+            transaction = self.transaction_dict.create_transaction(isolation_level=isolation_level)
+            transaction.start()
+            self.assertListEqual([other_key, self.key], list(transaction))
+            transaction.rollback()
+        self.assertEqual(self.transaction_dict.popitem(), (other_key, self.value2))
@@ -24,8 +24,13 @@ class LockStrategyTransactionTestsMixin(TransactionTestsMixin):
         )
 
 
-class AccessProtectorTestCase(LockStrategyTransactionTestsMixin, TestCase):
-    isolation_level = IsolationLevel.READ_COMMITTED
+class AccessProtectorTestCase(TestCase):
+    key1 = 'test_key1'
+    transaction1 = object()
+    transaction2 = object()
+
+    def setUp(self):
+        self.access_protector = AccessProtector()
 
     def test_can_add_full_lock_to_protector_only_with_own_key_locks(self):
         self.access_protector.add_key_lock(transaction=self.transaction1, key=self.key1)
@@ -83,6 +88,21 @@ class AccessProtectorTestCase(LockStrategyTransactionTestsMixin, TestCase):
         self.access_protector.del_full_lock()
         self.assertIsNone(self.access_protector.add_key_lock(transaction=self.transaction2, key=self.key1))
 
+    def test_can_add_full_lock_after_del_other_key_lock(self):
+        self.access_protector.add_key_lock(transaction=self.transaction1, key=self.key1)
+        self.access_protector.del_key_lock(key=self.key1)
+        self.assertIsNone(self.access_protector.add_full_lock(transaction=self.transaction2))
+
+    def test_can_add_full_lock_after_clear_other_key_lock(self):
+        self.access_protector.add_key_lock(transaction=self.transaction1, key=self.key1)
+        self.access_protector.clear_locks_by_transaction(transaction=self.transaction1)
+        self.assertIsNone(self.access_protector.add_full_lock(transaction=self.transaction2))
+
+    def test_can_add_full_lock_after_clear_other_full_lock(self):
+        self.access_protector.add_full_lock(transaction=self.transaction1)
+        self.access_protector.clear_locks_by_transaction(transaction=self.transaction1)
+        self.assertIsNone(self.access_protector.add_full_lock(transaction=self.transaction2))
+
 
 class LostUpdateTestCase(LockStrategyTransactionTestsMixin):
     def test_cannot_occur_lost_update(self):
@@ -109,6 +129,16 @@ class NonRepeatableReadTestCase(LockStrategyTransactionTestsMixin):
         with self.assertRaises(AccessError):
             self.transaction2[self.key3] = self.value2
 
+    def test_cannot_occur_non_repeatable_read_when_write_after_get_key(self):
+        _ = self.transaction1.get(self.key1)
+        with self.assertRaises(AccessError):
+            self.transaction2[self.key1] = self.value2
+
+    def test_cannot_occur_non_repeatable_read_when_write_after_get_new_key(self):
+        self.assertIsNone(self.transaction1.get(self.key3))
+        with self.assertRaises(AccessError):
+            self.transaction2[self.key3] = self.value2
+
     def test_cannot_occur_non_repeatable_read_when_delete_after_read_key(self):
         _ = self.transaction1[self.key1]
         with self.assertRaises(AccessError):
@@ -124,23 +154,13 @@ class NonRepeatableReadTestCase(LockStrategyTransactionTestsMixin):
         with self.assertRaises(AccessError):
             self.transaction2[self.key3] = self.value2
 
-
-class ReadUncommittedTransactionTestCase(LostUpdateTestCase, LockStrategyTransactionTestsMixin, TestCase):
-    isolation_level = IsolationLevel.READ_UNCOMMITTED
-
-    def test_can_occur_dirty_read(self):
-        first_read = self.transaction1[self.key1]
-        self.transaction2[self.key1] = self.value2
-        second_read = self.transaction1[self.key1]
+    def test_can_read_actual_value_after_commit_other_transaction(self):
         self.transaction2[self.key1] = self.value3
-        third_read = self.transaction1[self.key1]
-        self.transaction2.rollback()
-        fourth_read = self.transaction1[self.key1]
-        self.assertEqual(first_read, self.value1)
-        self.assertEqual(second_read, self.value2)
-        self.assertEqual(third_read, self.value3)
-        self.assertEqual(fourth_read, self.value1)
+        self.transaction2.commit()
+        self.assertEqual(self.transaction1[self.key1], self.value3)
+
 
+class ReadAnomaliesTestCase(LockStrategyTransactionTestsMixin):
     def test_can_occur_non_repeatable_read(self):
         first = self.transaction1[self.key1]
         self.transaction2[self.key1] = self.value2
@@ -157,7 +177,30 @@ class ReadUncommittedTransactionTestCase(LostUpdateTestCase, LockStrategyTransac
         self.assertEqual(second_read, first_read + 1)
 
 
-class ReadCommittedTransactionTestCase(LostUpdateTestCase, LockStrategyTransactionTestsMixin, TestCase):
+class ReadUncommittedTransactionTestCase(LostUpdateTestCase,
+                                         ReadAnomaliesTestCase,
+                                         LockStrategyTransactionTestsMixin,
+                                         TestCase):
+    isolation_level = IsolationLevel.READ_UNCOMMITTED
+
+    def test_can_occur_dirty_read(self):
+        first_read = self.transaction1[self.key1]
+        self.transaction2[self.key1] = self.value2
+        second_read = self.transaction1[self.key1]
+        self.transaction2[self.key1] = self.value3
+        third_read = self.transaction1[self.key1]
+        self.transaction2.rollback()
+        fourth_read = self.transaction1[self.key1]
+        self.assertEqual(first_read, self.value1)
+        self.assertEqual(second_read, self.value2)
+        self.assertEqual(third_read, self.value3)
+        self.assertEqual(fourth_read, self.value1)
+
+
+class ReadCommittedTransactionTestCase(LostUpdateTestCase,
+                                       ReadAnomaliesTestCase,
+                                       LockStrategyTransactionTestsMixin,
+                                       TestCase):
     isolation_level = IsolationLevel.READ_COMMITTED
 
     def test_cannot_occur_dirty_read(self):
@@ -167,21 +210,6 @@ class ReadCommittedTransactionTestCase(LostUpdateTestCase, LockStrategyTransacti
         self.assertEqual(first_read, self.value1)
         self.assertEqual(second_read, self.value1)
 
-    def test_can_occur_non_repeatable_read(self):
-        first = self.transaction1[self.key1]
-        self.transaction2[self.key1] = self.value2
-        self.transaction2.commit()
-        second = self.transaction1[self.key1]
-        self.assertEqual(first, self.value1)
-        self.assertEqual(second, self.value2)
-
-    def test_can_occur_phantoms_read(self):
-        first_read = len(self.transaction1)
-        self.transaction2[self.key3] = self.value3
-        self.transaction2.commit()
-        second_read = len(self.transaction1)
-        self.assertEqual(second_read, first_read + 1)
-
 
 class RepeatableReadTransactionTestCase(LostUpdateTestCase,
                                         NonRepeatableReadTestCase,
@@ -215,11 +243,6 @@ class RepeatableReadTransactionTestCase(LostUpdateTestCase,
         second_read = len(self.transaction1)
         self.assertEqual(second_read, first_read + 1)
 
-    def test_can_read_actual_value_after_commit_other_transaction(self):
-        self.transaction2[self.key1] = self.value3
-        self.transaction2.commit()
-        self.assertEqual(self.transaction1[self.key1], self.value3)
-
 
 class SerializableTransactionTestCase(LostUpdateTestCase,
                                       NonRepeatableReadTestCase,
@@ -258,8 +281,3 @@ class SerializableTransactionTestCase(LostUpdateTestCase,
         _ = next(it)
         with self.assertRaises(AccessError):
             self.transaction2[self.key2] = self.value2
-
-    def test_can_read_actual_value_after_commit_other_transaction(self):
-        self.transaction2[self.key1] = self.value3
-        self.transaction2.commit()
-        self.assertEqual(self.transaction1[self.key1], self.value3)
@@ -62,6 +62,26 @@ class CommonTransactionTestCase(MultiVersionStrategyTransactionTestsMixin):
         self.transaction2[self.key1] = self.value2
         self.assertEqual(self.transaction1[self.key1], self.value1)
 
+    def test_missing_key_error_carries_key(self):
+        with self.assertRaises(KeyError) as context:
+            _ = self.transaction1[self.key3]
+        self.assertEqual(context.exception.args, (self.key3,))
+        with self.assertRaises(KeyError) as context:
+            del self.transaction2[self.key3]
+        self.assertEqual(context.exception.args, (self.key3,))
+
+
+class SnapshotTransactionTestCase(MultiVersionStrategyTransactionTestsMixin):
+    def test_cannot_occur_non_repeatable_read(self):
+        self.transaction2[self.key1] = self.value2
+        self.transaction2.commit()
+        self.assertEqual(self.transaction1[self.key1], self.value1)
+
+    def test_cannot_occur_phantoms_read(self):
+        self.transaction2[self.key3] = self.value3
+        self.transaction2.commit()
+        self.assertNotIn(self.key3, self.transaction1)
+
 
 class ReadCommittedTransactionTestCase(CommonTransactionTestCase, MultiVersionStrategyTransactionTestsMixin, TestCase):
     isolation_level = IsolationLevel.READ_COMMITTED
@@ -78,33 +98,19 @@ class ReadCommittedTransactionTestCase(CommonTransactionTestCase, MultiVersionSt
         self.assertEqual(self.transaction1[self.key3], self.value3)
 
 
-class RepeatableReadTransactionTestCase(CommonTransactionTestCase, MultiVersionStrategyTransactionTestsMixin, TestCase):
+class RepeatableReadTransactionTestCase(CommonTransactionTestCase,
+                                        SnapshotTransactionTestCase,
+                                        MultiVersionStrategyTransactionTestsMixin,
+                                        TestCase):
     isolation_level = IsolationLevel.REPEATABLE_READ
 
-    def test_cannot_occur_non_repeatable_read(self):
-        self.transaction2[self.key1] = self.value2
-        self.transaction2.commit()
-        self.assertEqual(self.transaction1[self.key1], self.value1)
-
-    def test_cannot_occur_phantoms_read(self):
-        self.transaction2[self.key3] = self.value2
-        self.transaction2.commit()
-        self.assertNotIn(self.key3, self.transaction1)
-
 
-class SerializableTransactionTestCase(CommonTransactionTestCase, MultiVersionStrategyTransactionTestsMixin, TestCase):
+class SerializableTransactionTestCase(CommonTransactionTestCase,
+                                      SnapshotTransactionTestCase,
+                                      MultiVersionStrategyTransactionTestsMixin,
+                                      TestCase):
     isolation_level = IsolationLevel.SERIALIZABLE
 
-    def test_cannot_occur_non_repeatable_read(self):
-        self.transaction2[self.key1] = self.value2
-        self.transaction2.commit()
-        self.assertEqual(self.transaction1[self.key1], self.value1)
-
-    def test_cannot_occur_phantoms_read(self):
-        self.transaction2[self.key3] = self.value3
-        self.transaction2.commit()
-        self.assertNotIn(self.key3, self.transaction1)
-
     def test_cannot_occur_serializable_error_when_cross_write_keys(self):
         self.transaction1[self.key1] = self.value2
         _ = self.transaction1[self.key2]
@@ -165,6 +171,36 @@ class SerializableTransactionTestCase(CommonTransactionTestCase, MultiVersionStr
         self.transaction2.commit()
         self.assertIsNone(self.transaction1.commit())
 
+    def test_cannot_occur_serializable_error_when_write_key_after_get(self):
+        _ = self.transaction1.get(self.key2)
+        self.transaction2[self.key2] = self.value3
+        self.transaction2.commit()
+        self.transaction1[self.key1] = self.value2
+        with self.assertRaises(SerializationError):
+            self.transaction1.commit()
+
+    def test_cannot_occur_serializable_error_when_write_key_after_get_new_key(self):
+        self.assertIsNone(self.transaction1.get(self.key3))
+        self.transaction2[self.key3] = self.value3
+        self.transaction2.commit()
+        with self.assertRaises(SerializationError):
+            self.transaction1.commit()
+
+    def test_can_commit_when_rewrite_key_after_check_len(self):
+        _ = len(self.transaction1)
+        self.transaction2[self.key1] = self.value3
+        self.transaction2.commit()
+        self.assertIsNone(self.transaction1.commit())
+
+    def test_cannot_occur_serializable_error_when_len_is_changed_by_delete_and_write(self):
+        _ = len(self.transaction1)
+        del self.transaction2[self.key1]
+        del self.transaction2[self.key2]
+        self.transaction2[self.key3] = self.value3
+        self.transaction2.commit()
+        with self.assertRaises(SerializationError):
+            self.transaction1.commit()
+
     def test_cannot_occur_serializable_error_when_write_key_after_negative_check_contains(self):
         _ = self.key3 in self.transaction1
         self.transaction2[self.key3] = self.value3